@@ -1,4 +1,5 @@
 import logging
+from collections import Counter
 from typing import List, Optional
 
 import customtkinter as ctk
@@ -69,30 +70,18 @@ class HistoryController:
                 "engine_usage": {},
             }
 
-        engines_count: dict[str, int] = {}
-        sources = set()
-        targets = set()
-
-        for entry in history:
-            engines_count[entry.translation_engine] = (
-                engines_count.get(entry.translation_engine, 0) + 1
-            )
-            sources.add(entry.source_lang)
-            targets.add(entry.target_lang)
-
-        most_used_engine = (
-            max(engines_count.items(), key=lambda x: x[1])[0]
-            if engines_count
-            else None
-        )
+        engines_count = Counter(entry.translation_engine for entry in history)
+        sources = {entry.source_lang for entry in history}
+        targets = {entry.target_lang for entry in history}
+        most_common = engines_count.most_common(1)
 
         return {
             "total_entries": len(history),
             "unique_sources": len(sources),
             "unique_targets": len(targets),
-            "engines_used": list(engines_count.keys()),
-            "most_used_engine": most_used_engine,
-            "engine_usage": engines_count,
+            "engines_used": list(engines_count),
+            "most_used_engine": most_common[0][0] if most_common else None,
+            "engine_usage": dict(engines_count),
         }
 
     def clear_history(self) -> None:
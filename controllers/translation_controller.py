@@ -126,6 +126,8 @@ class TranslationController(TranslationWindowProtocol):
                 window_controller=self.window_controller,
                 opacity=opacity,
                 initial_text="",
+                game_mode=self.config_model.get_config(
+                    "window", "game_mode", False),
             )
 
             if self.translation_window is not None:
@@ -398,8 +400,7 @@ class TranslationController(TranslationWindowProtocol):
                 success = self.translation_window.set_text(text)
                 if success:
                     logging.info("Successfully updated translation window")
-                    self.translation_window.lift()
-                    self.translation_window.focus_force()
+                    self.translation_window.bring_to_front()
                 else:
                     logging.error("Failed to set text in translation window")
         except Exception as e:
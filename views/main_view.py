@@ -27,6 +27,18 @@ except ImportError:
     MessageBox = CTkMessageboxFallback
 
 
+# Constants
+SHORTCUTS = (
+    ("Ctrl + Space", "Start/Stop Translation"),
+    ("Ctrl + R", "Select Region"),
+    ("Ctrl + T", "Change Translation Engine"),
+    ("Ctrl + O", "Change OCR Engine"),
+    ("Ctrl + H", "Show History"),
+)
+SHORTCUT_LINES = tuple(f"{key:<15} - {desc}" for key, desc in SHORTCUTS)
+SHORTCUT_FONT = ("Arial", 11)
+
+
 class MainViewProtocol(Protocol):
     """Protocol defining the interface for main view callbacks"""
 
@@ -121,16 +133,11 @@ class MainView:
 
     @staticmethod
     def _create_shortcut_label(
-        parent: Union[ctk.CTkFrame, ctk.CTkScrollableFrame],
-        key: str,
-        description: str,
+        parent: Union[ctk.CTkFrame, ctk.CTkScrollableFrame], line: str
     ) -> ctk.CTkLabel:
-        """Create a shortcut label with consistent formatting"""
+        """Create a shortcut label from a preformatted line"""
         return ctk.CTkLabel(
-            parent,
-            text=f"{key:<15} - {description}",
-            font=("Arial", 11),
-            justify="left",
+            parent, text=line, font=SHORTCUT_FONT, justify="left"
         )
 
     @staticmethod
@@ -203,14 +210,11 @@ class MainView:
         self.opacity_var = ctk.DoubleVar(value=0.9)
         opacity_slider = ctk.CTkSlider(
             opacity_frame,
-            from_=10,  # 10% minimum
-            to=100,  # 100% maximum
-            variable=None,  # Don't bind directly to avoid type issues
+            from_=0.1,  # 10% minimum
+            to=1.0,  # 100% maximum
+            variable=self.opacity_var,
             command=self._on_opacity_change,
         )
-        opacity_slider.set(
-            self.opacity_var.get() * 100
-        )  # Convert to percentage
         opacity_slider.pack(side="left", fill="x", expand=True, padx=5)
 
         # Language Settings Section
@@ -315,18 +319,8 @@ class MainView:
             font=("Arial", 12, "bold"),
         ).pack(anchor="w", padx=5, pady=(5, 2))
 
-        shortcuts = [
-            ("Ctrl + Space", "Start/Stop Translation"),
-            ("Ctrl + R", "Select Region"),
-            ("Ctrl + T", "Change Translation Engine"),
-            ("Ctrl + O", "Change OCR Engine"),
-            ("Ctrl + H", "Show History"),
-        ]
-
-        for key, description in shortcuts:
-            shortcut_label = self._create_shortcut_label(
-                shortcuts_frame, key, description
-            )
+        for line in SHORTCUT_LINES:
+            shortcut_label = self._create_shortcut_label(shortcuts_frame, line)
             shortcut_label.pack(anchor="w", padx=5, pady=1)
 
         # Toast notification
@@ -387,6 +381,5 @@ class MainView:
 
     def _on_opacity_change(self, value: float):
         """Handle opacity slider change"""
-        opacity = float(value) / 100  # Convert percentage to 0-1 range
-        self.opacity_var.set(opacity)
-        self.controller.on_change_opacity(opacity)
+        # The slider writes opacity_var itself and already works in 0-1 range
+        self.controller.on_change_opacity(value)
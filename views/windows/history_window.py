@@ -1,19 +1,54 @@
 import logging
-from datetime import datetime
-from typing import Callable, Dict, List, Optional, Protocol
+import math
+import shelve
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from tkinter import font as tkfont
+from tkinter import messagebox
+from typing import Callable, Dict, List, Optional, Protocol, Tuple
 
 import customtkinter as ctk
-import pyperclip
-from CTkMessagebox import CTkMessagebox
+import numpy as np
 
 from models.translation_model import TranslationEntry
 
 # Constants
-CHUNK_SIZE = 20
-DEBOUNCE_DELAY = 300
+ROW_HEIGHT = 36
+ROW_PADDING = 5
+PREVIEW_X = 150
+POOL_OVERSCAN = 2
+ROW_FONT = ("Helvetica", 11)
+ROW_SMALL_FONT = ("Helvetica", 10)
+ROW_COLOR = ("gray85", "gray25")
+ROW_HOVER_COLOR = ("gray75", "gray30")
+ROW_TEXT_COLOR = ("gray10", "#DCE4EE")
+DEBOUNCE_QUICK = 100
+DEBOUNCE_STANDARD = 300
 PREVIEW_LENGTH = 50
 DATE_FILTER_OPTIONS = ["All Time", "Today", "Last 7 Days", "Last 30 Days"]
 DEFAULT_ENGINE = "All Engines"
+STATS_CACHE_FILE = "history_stats"
+DATE_FILTER_DAYS = {"Last 7 Days": 7, "Last 30 Days": 30}
+
+# Worker threads of different history windows can overlap, and the dbm
+# backends behind shelve are not safe for concurrent access
+_stats_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _date_cutoff(filter_type: str, today: date) -> Optional[int]:
+    """Get the earliest Unix timestamp a date filter keeps, or None"""
+    if filter_type == "Today":
+        days = 0
+    elif filter_type in DATE_FILTER_DAYS:
+        days = DATE_FILTER_DAYS[filter_type]
+    else:
+        return None
+    start = datetime.combine(today - timedelta(days=days), datetime.min.time())
+    return int(start.timestamp())
 
 
 class HistoryWindowProtocol(Protocol):
@@ -31,9 +66,42 @@ class HistoryWindow(ctk.CTkToplevel):
 
         self.controller = controller
         self.entries: List[TranslationEntry] = []
+        # Treated as read-only: aliases self.entries until a filter runs
         self.filtered_entries: List[TranslationEntry] = []
-        self._search_after_id: Optional[str] = None
+        # Indices into self.entries of the shown rows; None when unfiltered
+        self._filtered_indices: Optional[List[int]] = None
+        self._filter_after_id: Optional[str] = None
         self._stats: Dict = {}
+        self._last_stats: Dict[str, str] = {}
+        self._last_engines: List[str] = []
+        self._engines_count: Counter = Counter()
+        self._sources: set = set()
+        self._targets: set = set()
+        self._row_pool: List[dict] = []
+        self._list_width = 1
+        self._first_visible = 0
+        self._hover_row: Optional[dict] = None
+        self._current_entry: Optional[TranslationEntry] = None
+        # Per-entry caches, parallel to self.entries
+        self._search_blob: List[bytes] = []
+        self._timestr: List[str] = []
+        self._preview: List[str] = []
+        self._infostr: List[str] = []
+        self._timestamps: np.ndarray = np.empty(0, dtype=np.int64)
+        self._engine_names: np.ndarray = np.empty(0, dtype=str)
+        self._timestamps_sorted = True
+        self._last_filter_key: Optional[tuple] = None
+        self._last_search_text = ""
+        self._last_search_result: List[int] = []
+        self._stats_pending = False
+
+        # Filter and full stats passes run on a worker thread; queued jobs
+        # are cancelled when superseded and stale results are discarded
+        # by generation number
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._generations: Dict[str, int] = {"filter": 0, "stats": 0}
+        self._futures: Dict[str, Future] = {}
+        self._closed = False
 
         # Create main container
         self.container = ctk.CTkFrame(self)
@@ -65,105 +133,277 @@ class HistoryWindow(ctk.CTkToplevel):
         )
 
     def load_entries(self, entries: List[TranslationEntry]) -> None:
-        """Load history entries with error handling"""
+        """Load history entries once pending window events are handled"""
+        self.toast_label.configure(text="Loading history...")
+        self.after_idle(self._finish_loading, entries)
+
+    def _finish_loading(self, entries: List[TranslationEntry]) -> None:
+        """Build entry caches and show the loaded entries"""
         try:
             self.entries = entries
-            self.filtered_entries = entries.copy()
+            self.filtered_entries = entries
+            self._filtered_indices = None
+            self._build_search_cache()
 
             # Pre-calculate stats
             self._calculate_stats()
 
-            # Load entries in chunks
-            self.after(10, self._load_entries_chunk, 0, CHUNK_SIZE)
+            self._refresh_list()
 
         except Exception as e:
             logging.error(f"Error loading entries: {e}")
             self.show_error("Error", "Failed to load history entries")
+        finally:
+            self.toast_label.configure(text="")
+
+    def _build_search_cache(self, start: int = 0) -> None:
+        """Precompute search, filter and display data for entries from start"""
+        # Results of in-flight filter passes refer to the old entries
+        self._generations["filter"] += 1
+        self._last_filter_key = None
+
+        new_entries = self.entries[start:]
+        self._timestamps = np.concatenate(
+            (
+                self._timestamps[:start],
+                np.fromiter(
+                    (
+                        int(entry.timestamp.timestamp())
+                        for entry in new_entries
+                    ),
+                    dtype=np.int64,
+                    count=len(new_entries),
+                ),
+            )
+        )
+        # History is normally chronological, which allows binary search
+        self._timestamps_sorted = bool(
+            np.all(self._timestamps[1:] >= self._timestamps[:-1])
+        )
+        self._engine_names = np.concatenate(
+            (
+                self._engine_names[:start],
+                np.array(
+                    [entry.translation_engine for entry in new_entries],
+                    dtype=str,
+                ),
+            )
+        )
 
-    def _calculate_stats(self):
-        """Pre-calculate statistics"""
-        if not self.entries:
-            self._stats = {
-                "total_entries": 0,
-                "unique_sources": 0,
-                "unique_targets": 0,
-                "engines_used": [],
-                "most_used_engine": None,
-                "engine_usage": {},
-            }
+        search_blob: List[bytes] = []
+        timestr: List[str] = []
+        previews: List[str] = []
+        infostr: List[str] = []
+        for entry in new_entries:
+            # The separator keeps matches from spanning both texts; UTF-8
+            # bytes are searched with a plain byte scan
+            blob = f"{entry.source_text}\x1f{entry.translated_text}".lower()
+            search_blob.append(blob.encode("utf-8", "ignore"))
+            timestr.append(entry.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+            # OCR text is often multi-line; rows show a single line
+            preview = " ".join(entry.translated_text.split())
+            previews.append(
+                preview[:PREVIEW_LENGTH] + "..."
+                if len(preview) > PREVIEW_LENGTH
+                else preview
+            )
+            infostr.append(
+                f"{entry.source_lang} → {entry.target_lang} | "
+                f"{entry.translation_engine}"
+            )
+
+        # Swap in new lists; the worker may still be reading the old ones
+        self._search_blob = self._search_blob[:start] + search_blob
+        self._timestr = self._timestr[:start] + timestr
+        self._preview = self._preview[:start] + previews
+        self._infostr = self._infostr[:start] + infostr
+
+    def _submit(self, kind: str, func: Callable, args: tuple, callback):
+        """Queue a job for the worker, superseding older jobs of its kind"""
+        self._generations[kind] += 1
+        generation = self._generations[kind]
+
+        previous = self._futures.get(kind)
+        if previous is not None:
+            previous.cancel()
+
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(
+            lambda done: self._on_job_done(done, generation, callback)
+        )
+        self._futures[kind] = future
+
+    def _on_job_done(self, future: Future, generation: int, callback):
+        """Hand a finished worker job back to the Tk thread"""
+        if future.cancelled() or self._closed:
             return
 
-        engines_count: dict[str, int] = {}
-        sources = set()
-        targets = set()
+        error = future.exception()
+        if error is not None:
+            logging.error(f"Error in history worker: {error}")
+            return
 
-        for entry in self.entries:
-            engines_count[entry.translation_engine] = (
-                engines_count.get(entry.translation_engine, 0) + 1
-            )
-            sources.add(entry.source_lang)
-            targets.add(entry.target_lang)
+        try:
+            self.after(0, callback, generation, future.result())
+        except RuntimeError:
+            # The main loop has already exited
+            pass
 
-        most_used_engine = (
-            max(engines_count.items(), key=lambda x: x[1])[0]
-            if engines_count
-            else None
+    def _calculate_stats(self):
+        """Queue a full statistics calculation on the worker"""
+        self._stats_pending = True
+        self._submit(
+            "stats", self._compute_stats, (self.entries,), self._on_stats
         )
 
-        self._stats = {
-            "total_entries": len(self.entries),
-            "unique_sources": len(sources),
-            "unique_targets": len(targets),
-            "engines_used": list(engines_count.keys()),
-            "most_used_engine": most_used_engine,
-            "engine_usage": engines_count,
-        }
+    @classmethod
+    def _compute_stats(
+        cls, entries: List[TranslationEntry]
+    ) -> Tuple[Counter, set, set]:
+        """Calculate engine counts and language sets for entries"""
+        cache_key = cls._stats_cache_key(entries)
+        cached = cls._read_cached_stats(cache_key)
+        if cached is not None:
+            return cached
+
+        engines_count = Counter(entry.translation_engine for entry in entries)
+        sources = {entry.source_lang for entry in entries}
+        targets = {entry.target_lang for entry in entries}
+
+        cls._write_cached_stats(cache_key, (engines_count, sources, targets))
+        return engines_count, sources, targets
+
+    def _on_stats(self, generation: int, result: tuple) -> None:
+        """Show statistics calculated by the worker"""
+        if generation != self._generations["stats"]:
+            return
 
-        self.update_stats(self._stats)
+        self._stats_pending = False
+        self._engines_count, self._sources, self._targets = result
+        self._publish_stats()
+        self._update_engine_options()
 
-    def _load_entries_chunk(self, start: int, chunk_size: int):
-        """Load entries in chunks to prevent UI freezing"""
-        end = min(start + chunk_size, len(self.filtered_entries))
+    @staticmethod
+    def _stats_cache_key(entries: List[TranslationEntry]) -> str:
+        """Identify a history by its size and newest entry"""
+        if not entries:
+            return "0"
+        return f"{len(entries)}:{entries[-1].timestamp.isoformat()}"
 
-        # Clear widgets if this is the first chunk
-        if start == 0:
-            for widget in self.history_frame.winfo_children():
-                widget.destroy()
+    @staticmethod
+    def _read_cached_stats(cache_key: str) -> Optional[tuple]:
+        """Load statistics persisted for the same history, if any"""
+        try:
+            with _stats_cache_lock, shelve.open(STATS_CACHE_FILE) as shelf:
+                cached = shelf.get("stats")
+        except Exception as e:
+            logging.error(f"Error reading stats cache: {e}")
+            return None
 
-        # Create widgets for this chunk
-        for entry in self.filtered_entries[start:end]:
-            self._create_entry_widget(entry)
+        if cached is None or cached[0] != cache_key:
+            return None
+        return cached[1:]
 
-        # Schedule next chunk if needed
-        if end < len(self.filtered_entries):
-            self.after(10, self._load_entries_chunk, end, chunk_size)
-        else:
-            # Update engine options after all entries are loaded
-            self._update_engine_options()
+    @staticmethod
+    def _write_cached_stats(cache_key: str, stats: tuple) -> None:
+        """Persist statistics so reopening the window can skip the scan"""
+        try:
+            with _stats_cache_lock, shelve.open(STATS_CACHE_FILE) as shelf:
+                shelf["stats"] = (cache_key, *stats)
+        except Exception as e:
+            logging.error(f"Error writing stats cache: {e}")
 
-    def update_stats(self, stats: dict):
-        """Update statistics display"""
-        self.total_label.configure(
-            text=f"Total Entries: {
-                stats['total_entries']}"
-        )
-        self.sources_label.configure(
-            text=f"Unique Source Languages: {
-                stats['unique_sources']}"
-        )
-        self.targets_label.configure(
-            text=f"Unique Target Languages: {
-                stats['unique_targets']}"
+    def _add_entry_stats(self, entry: TranslationEntry) -> None:
+        """Fold a single entry into the running statistics"""
+        self._engines_count[entry.translation_engine] += 1
+        self._sources.add(entry.source_lang)
+        self._targets.add(entry.target_lang)
+
+    def _publish_stats(self) -> None:
+        """Build the stats dict from the running statistics and show it"""
+        most_common = self._engines_count.most_common(1)
+
+        self._stats = {
+            "total_entries": len(self.entries),
+            "unique_sources": len(self._sources),
+            "unique_targets": len(self._targets),
+            "engines_used": list(self._engines_count),
+            "most_used_engine": most_common[0][0] if most_common else None,
+            "engine_usage": dict(self._engines_count),
+        }
+
+        self.update_stats(self._stats)
+
+    def _refresh_list(self) -> None:
+        """Resize the virtual list to filtered_entries and scroll to top"""
+        self.history_canvas.configure(
+            scrollregion=(
+                0,
+                0,
+                self.history_canvas.winfo_width(),
+                len(self.filtered_entries) * ROW_HEIGHT,
+            )
         )
+        self.history_canvas.yview_moveto(0)
+        self._render_visible_rows()
+
+    def _render_visible_rows(self) -> None:
+        """Bind pooled canvas rows to the entries inside the viewport"""
+        total = len(self.filtered_entries)
+        first = int(self.history_canvas.yview()[0] * total)
+        self._first_visible = first
+        self._set_hover_row(None)
+
+        # Only touch Tk for rows whose entry, position or visibility changed
+        canvas = self.history_canvas
+        indices = self._filtered_indices
+        for slot, row in enumerate(self._row_pool):
+            index = first + slot
+            if index < total:
+                entry = self.filtered_entries[index]
+                source = index if indices is None else indices[index]
+                if row["entry"] is not entry:
+                    self._populate_row(row, source)
+                if row["index"] != index:
+                    if row["index"] is None:
+                        canvas.itemconfigure(row["tag"], state="normal")
+                    self._place_row(row, index * ROW_HEIGHT)
+                    row["index"] = index
+                if row["fit_width"] != self._list_width:
+                    self._fit_preview(row, source)
+            elif row["index"] is not None:
+                row["entry"] = None
+                row["index"] = None
+                canvas.itemconfigure(row["tag"], state="hidden")
 
-        if stats["most_used_engine"]:
-            engine_text = f"Most Used Engine: {stats['most_used_engine']}"
+    def update_stats(self, stats: dict):
+        """Update statistics display, skipping labels that are unchanged"""
+        most_used_engine = stats["most_used_engine"]
+        if not most_used_engine:
+            engine_text = "No translations yet"
+        else:
+            engine_text = f"Most Used Engine: {most_used_engine}"
             if stats["engine_usage"]:
-                usage = stats["engine_usage"][stats["most_used_engine"]]
+                usage = stats["engine_usage"][most_used_engine]
                 engine_text += f" ({usage} times)"
-            self.engine_label.configure(text=engine_text)
-        else:
-            self.engine_label.configure(text="No translations yet")
+
+        texts = {
+            "total": f"Total Entries: {stats['total_entries']}",
+            "sources": f"Unique Source Languages: {stats['unique_sources']}",
+            "targets": f"Unique Target Languages: {stats['unique_targets']}",
+            "engine": engine_text,
+        }
+        labels = {
+            "total": self.total_label,
+            "sources": self.sources_label,
+            "targets": self.targets_label,
+            "engine": self.engine_label,
+        }
+
+        for field, text in texts.items():
+            if self._last_stats.get(field) != text:
+                labels[field].configure(text=text)
+                self._last_stats[field] = text
 
     def _create_stats_panel(self):
         """Create statistics panel"""
@@ -207,15 +447,12 @@ class HistoryWindow(ctk.CTkToplevel):
     def _on_clear_history(self) -> None:
         """Handle clear history button click with confirmation"""
         try:
-            result = CTkMessagebox(
-                title="Clear History",
-                message="Are you sure you want to clear all history?",
+            if messagebox.askyesno(
+                "Clear History",
+                "Are you sure you want to clear all history?",
                 icon="warning",
-                option_1="Yes",
-                option_2="No",
-            ).get()
-
-            if result == "Yes":
+                parent=self,
+            ):
                 self.controller.clear_history()
                 self.show_toast("History cleared successfully")
 
@@ -227,8 +464,22 @@ class HistoryWindow(ctk.CTkToplevel):
         """Handle window close"""
         self.destroy()
 
+    def destroy(self):
+        """Stop the worker and pending timers before destroying the window"""
+        # Results still in flight must not reach the destroyed widgets
+        self._closed = True
+        for kind in self._generations:
+            self._generations[kind] += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        super().destroy()
+
     def show_error(self, title: str, message: str):
         """Show error dialog"""
+        from CTkMessagebox import CTkMessagebox
+
         CTkMessagebox(master=self, title=title, message=message, icon="cancel")
 
     def show_toast(self, message: str):
@@ -285,9 +536,36 @@ class HistoryWindow(ctk.CTkToplevel):
         list_frame = ctk.CTkFrame(split_container)
         list_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
-        # Scrollable frame for entries
-        self.history_frame = ctk.CTkScrollableFrame(list_frame)
-        self.history_frame.pack(fill="both", expand=True)
+        # Row fonts, used to fit previews beside the info column
+        self._row_font = tkfont.Font(self, font=ROW_FONT)
+        self._row_small_font = tkfont.Font(self, font=ROW_SMALL_FONT)
+
+        # Row colors resolved once for the canvas items
+        self._row_color = self._apply_appearance_mode(ROW_COLOR)
+        self._row_hover_color = self._apply_appearance_mode(ROW_HOVER_COLOR)
+        self._row_text_color = self._apply_appearance_mode(ROW_TEXT_COLOR)
+
+        # Virtual list: only a viewport-sized pool of rows is ever created
+        scrollbar = ctk.CTkScrollbar(
+            list_frame, orientation="vertical", command=self._on_list_scroll
+        )
+        scrollbar.pack(side="right", fill="y")
+
+        self.history_canvas = ctk.CTkCanvas(
+            list_frame,
+            bg=self._apply_appearance_mode(list_frame.cget("fg_color")),
+            highlightthickness=0,
+            yscrollincrement=ROW_HEIGHT,
+            yscrollcommand=scrollbar.set,
+            cursor="hand2",
+        )
+        self.history_canvas.pack(side="left", fill="both", expand=True)
+
+        self.history_canvas.bind("<Configure>", self._on_list_configure)
+        self.history_canvas.bind("<Button-1>", self._on_list_click)
+        self.history_canvas.bind("<Motion>", self._on_list_motion)
+        self.history_canvas.bind("<Leave>", self._on_list_leave)
+        self._bind_mouse_wheel(self.history_canvas)
 
         # Right side: Detail view
         detail_frame = ctk.CTkFrame(split_container)
@@ -343,208 +621,337 @@ class HistoryWindow(ctk.CTkToplevel):
 
     def _copy_text(self, text: str):
         """Copy text to clipboard"""
-        pyperclip.copy(text)
+        self.clipboard_clear()
+        self.clipboard_append(text)
+        self.update_idletasks()
         self.show_toast("Text copied to clipboard")
         self.controller.on_copy_text(text)
 
     def _update_engine_options(self):
-        """Update engine filter options"""
-        engines = set(entry.translation_engine for entry in self.entries)
-        self.engine_var.set("All Engines")
-        self.engine_menu.configure(
-            values=["All Engines"] + sorted(list(engines))
+        """Update engine filter options from the calculated stats"""
+        engines = sorted(self._stats.get("engine_usage", {}))
+        self.engine_var.set(DEFAULT_ENGINE)
+        if engines != self._last_engines:
+            self._last_engines = engines
+            self.engine_menu.configure(values=[DEFAULT_ENGINE] + engines)
+
+    def _apply_filters_now(self) -> None:
+        """Queue a filter pass for the current filter inputs"""
+        self._filter_after_id = None
+
+        self._submit(
+            "filter",
+            self._compute_filter,
+            (
+                len(self.entries),
+                self._search_blob,
+                self._timestamps,
+                self._timestamps_sorted,
+                self._engine_names,
+                self.engine_var.get(),
+                self.date_var.get(),
+                date.today(),
+                self.search_var.get().lower(),
+                self._last_filter_key,
+                self._last_search_text,
+                self._last_search_result,
+            ),
+            self._on_filter,
         )
 
-    def _apply_filters(self) -> None:
-        """Apply filters efficiently using generator expressions"""
-        if self._search_after_id:
-            self.after_cancel(self._search_after_id)
-            self._search_after_id = None
-
-        filtered = list(self.entries)
-
-        # Apply engine filter
-        engine = self.engine_var.get()
-        if engine != DEFAULT_ENGINE:
-            filtered = list(
-                entry
-                for entry in filtered
-                if entry.translation_engine == engine
-            )
-
-        # Apply date filter
-        date_filter = self._get_date_filter_function(self.date_var.get())
-        filtered = list(filter(date_filter, filtered))
-
-        # Apply search filter
-        search_text = self.search_var.get().lower()
-        if search_text:
-            filtered = list(
-                entry
-                for entry in filtered
-                if search_text in entry.source_text.lower()
-                or search_text in entry.translated_text.lower()
-            )
-
-        # Convert to list for UI update
-        self._update_filtered_entries(filtered)
-
     @staticmethod
-    def _get_date_filter_function(
-        filter_type: str,
-    ) -> Callable[[TranslationEntry], bool]:
-        """Get the appropriate date filter function based on filter type"""
-        now = datetime.now()
-
-        if filter_type == "All Time":
-            return lambda entry: True
-        elif filter_type == "Today":
-            return lambda entry: entry.timestamp.date() == now.date()
-        elif filter_type == "Last 7 Days":
-            return lambda entry: (now - entry.timestamp).days <= 7
-        elif filter_type == "Last 30 Days":
-            return lambda entry: (now - entry.timestamp).days <= 30
+    def _compute_filter(
+        entry_count: int,
+        search_blob: List[bytes],
+        timestamps: np.ndarray,
+        timestamps_sorted: bool,
+        engine_names: np.ndarray,
+        engine: str,
+        date_filter: str,
+        today: date,
+        search_text: str,
+        last_filter_key: Optional[tuple],
+        last_search_text: str,
+        last_search_result: List[int],
+    ) -> tuple:
+        """Get the indices of entries matching engine, date and search"""
+        needle = search_text.encode("utf-8", "ignore")
+        filter_key = (engine, date_filter, today)
+        if filter_key == last_filter_key and search_text.startswith(
+            last_search_text
+        ):
+            # Extending the search can only narrow the previous result
+            result = [
+                i for i in last_search_result if needle in search_blob[i]
+            ]
         else:
-            return lambda entry: True
+            start = 0
+            cutoff = _date_cutoff(date_filter, today)
+            if cutoff is not None and timestamps_sorted:
+                # Entries before the first one at the cutoff are all older
+                start = int(np.searchsorted(timestamps, cutoff))
+                cutoff = None
+
+            # Engine and date filters are vectorized masks over the rest
+            mask = np.ones(entry_count - start, dtype=bool)
+            if engine != DEFAULT_ENGINE:
+                mask &= engine_names[start:] == engine
+            if cutoff is not None:
+                mask &= timestamps[start:] >= cutoff
+
+            result = (np.flatnonzero(mask) + start).tolist()
+            if needle:
+                result = [i for i in result if needle in search_blob[i]]
+
+        return filter_key, search_text, result
+
+    def _on_filter(self, generation: int, outcome: tuple) -> None:
+        """Show the result of a filter pass computed by the worker"""
+        if generation != self._generations["filter"]:
+            return
+
+        filter_key, search_text, result = outcome
+        self._last_filter_key = filter_key
+        self._last_search_text = search_text
+        self._last_search_result = result
+        self._update_filtered_entries(result)
 
     def _update_filtered_entries(
-        self, filtered_entries: List[TranslationEntry]
+        self, indices: Optional[List[int]]
     ) -> None:
-        """Update UI with filtered entries"""
-        self.filtered_entries = filtered_entries
-        self._load_entries_chunk(0, CHUNK_SIZE)
-        self._calculate_stats()
+        """Update UI with the entries at the filtered indices"""
+        # Indices are ascending, so a full-length result is every entry
+        if len(indices) == len(self.entries):
+            indices = None
+
+        if indices == self._filtered_indices:
+            # Same rows in the same order: keep the list and scroll position
+            return
+
+        self._filtered_indices = indices
+        if indices is None:
+            self.filtered_entries = self.entries
+        else:
+            self.filtered_entries = [self.entries[i] for i in indices]
+        self._refresh_list()
+
+    def _schedule_apply(self, delay: int = DEBOUNCE_QUICK) -> None:
+        """Coalesce filter changes into a single delayed filter pass"""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(delay, self._apply_filters_now)
 
     def _on_search_change(self, *_):
         """Handle search text change with debouncing"""
-        if self._search_after_id:
-            self.after_cancel(self._search_after_id)
-        self._search_after_id = self.after(DEBOUNCE_DELAY, self._apply_filters)
+        self._schedule_apply(DEBOUNCE_STANDARD)
 
     def _on_engine_filter_change(self, _: str):
         """Handle engine filter change"""
-        self._apply_filters()
+        self._schedule_apply()
 
     def _on_date_filter_change(self, _: str):
         """Handle date filter change"""
-        self._apply_filters()
+        self._schedule_apply()
 
     def update_entries(self, entries: List[TranslationEntry]):
         """Update history entries"""
+        previous = self.entries
         self.entries = entries
-        self.filtered_entries = entries.copy()
-        self._calculate_stats()
-        self._load_entries_chunk(0, CHUNK_SIZE)
-        self._update_engine_options()
-
-    @staticmethod
-    def _create_entry_widgets(
-        frame: ctk.CTkFrame, entry: TranslationEntry
-    ) -> dict:
-        """Create and layout widgets for an entry"""
-        try:
-            # Timestamp
-            time_label = ctk.CTkLabel(
-                frame,
-                text=entry.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                font=("Helvetica", 10),
-            )
-            time_label.grid(row=0, column=0, sticky="w", padx=5)
-
-            # Preview text (truncated)
-            preview = (
-                entry.translated_text[:PREVIEW_LENGTH] + "..."
-                if len(entry.translated_text) > PREVIEW_LENGTH
-                else entry.translated_text
-            )
-            preview_label = ctk.CTkLabel(
-                frame, text=preview, anchor="w", justify="left"
-            )
-            preview_label.grid(row=0, column=1, sticky="ew", padx=5)
-
-            # Engine and language info
-            info_text = f"{
-                entry.source_lang} → {
-                entry.target_lang} | {
-                entry.translation_engine}"
-            info_label = ctk.CTkLabel(
-                frame, text=info_text, font=("Helvetica", 10)
-            )
-            info_label.grid(row=0, column=2, sticky="e", padx=5)
+        self.filtered_entries = entries
+        self._filtered_indices = None
 
-            return {
-                "time_label": time_label,
-                "preview_label": preview_label,
-                "info_label": info_label,
-            }
-
-        except Exception as e:
-            logging.error(f"Error creating entry widgets: {e}")
-            raise
-
-    def _create_entry_widget(self, entry: TranslationEntry) -> None:
-        """Create optimized entry widget with error handling"""
-        try:
-            frame = ctk.CTkFrame(self.history_frame)
-            frame.pack(fill="x", padx=5, pady=2)
-
-            # Use grid layout for better performance
-            frame.grid_columnconfigure(1, weight=1)
-
-            # Create widgets with error handling
-            widgets = self._create_entry_widgets(frame, entry)
-            self._setup_entry_bindings(frame, widgets, entry)
-
-        except Exception as e:
-            logging.error(f"Error creating entry widget: {e}")
-            self.show_error("Error", "Failed to create history entry")
-
-    def _setup_entry_bindings(
-        self,
-        frame: ctk.CTkFrame,
-        widgets: dict,
-        current_entry: TranslationEntry,
-    ) -> None:
-        """Setup event bindings for entry widgets"""
-        try:
-
-            def on_click(_event, entry=current_entry):
-                self._show_entry_details(entry)
-
-            def on_enter(_event):
-                frame.configure(fg_color=("gray75", "gray30"))
+        # History is append-only, so only process the new tail when possible
+        appended = len(entries) >= len(previous) and (
+            not previous or entries[len(previous) - 1] is previous[-1]
+        )
+        self._build_search_cache(len(previous) if appended else 0)
 
-            def on_leave(_event):
-                frame.configure(fg_color=("gray85", "gray25"))
+        if appended and not self._stats_pending:
+            for entry in entries[len(previous):]:
+                self._add_entry_stats(entry)
+            self._publish_stats()
+            self._update_engine_options()
+        else:
+            self._calculate_stats()
+        self._refresh_list()
 
-            # Configure frame
-            frame.configure(fg_color=("gray85", "gray25"), cursor="hand2")
+    def _on_list_configure(self, event) -> None:
+        """Grow the row pool to cover the viewport and match canvas width"""
+        if event.width != self._list_width:
+            self._list_width = event.width
+            self._invalidate_row_positions()
 
-            # Bind events to frame and all labels
-            for widget in [frame] + list(widgets.values()):
-                widget.bind("<Button-1>", on_click)
-                widget.bind("<Enter>", on_enter)
-                widget.bind("<Leave>", on_leave)
+        needed = math.ceil(event.height / ROW_HEIGHT) + POOL_OVERSCAN
+        while len(self._row_pool) < needed:
+            self._row_pool.append(self._create_pool_row())
 
-                # Make labels look clickable
-                if isinstance(widget, ctk.CTkLabel):
-                    widget.configure(cursor="hand2")
+        self.history_canvas.configure(
+            scrollregion=(
+                0, 0, event.width, len(self.filtered_entries) * ROW_HEIGHT
+            )
+        )
+        self._render_visible_rows()
+
+    def _invalidate_row_positions(self) -> None:
+        """Force visible rows to be re-placed on the next render"""
+        for row in self._row_pool:
+            if row["index"] is not None:
+                row["index"] = -1
+
+    def _on_list_scroll(self, *args) -> None:
+        """Handle scrollbar movement"""
+        self.history_canvas.yview(*args)
+        self._render_visible_rows()
+
+    def _on_mouse_wheel(self, event) -> None:
+        """Scroll the list by whole rows"""
+        if event.num == 4 or event.delta > 0:
+            self.history_canvas.yview_scroll(-1, "units")
+        else:
+            self.history_canvas.yview_scroll(1, "units")
+        self._render_visible_rows()
+
+    def _bind_mouse_wheel(self, widget) -> None:
+        """Route mouse wheel events on a widget to the list"""
+        widget.bind("<MouseWheel>", self._on_mouse_wheel)
+        widget.bind("<Button-4>", self._on_mouse_wheel)
+        widget.bind("<Button-5>", self._on_mouse_wheel)
+
+    def _on_list_click(self, event) -> None:
+        """Show details of the row under the cursor"""
+        index = int(self.history_canvas.canvasy(event.y) // ROW_HEIGHT)
+        if 0 <= index < len(self.filtered_entries):
+            self._show_entry_details(self.filtered_entries[index])
+
+    def _on_list_motion(self, event) -> None:
+        """Highlight the row under the cursor"""
+        index = int(self.history_canvas.canvasy(event.y) // ROW_HEIGHT)
+        slot = index - self._first_visible
+        row = None
+        if 0 <= slot < len(self._row_pool):
+            if self._row_pool[slot]["index"] == index:
+                row = self._row_pool[slot]
+        self._set_hover_row(row)
+
+    def _on_list_leave(self, _event) -> None:
+        """Clear the row highlight when the cursor leaves the list"""
+        self._set_hover_row(None)
+
+    def _set_hover_row(self, row: Optional[dict]) -> None:
+        """Move the hover highlight to another pooled row"""
+        if row is self._hover_row:
+            return
 
-        except Exception as e:
-            logging.error(f"Error setting up entry bindings: {e}")
-            raise
+        canvas = self.history_canvas
+        if self._hover_row is not None:
+            canvas.itemconfigure(self._hover_row["bg"], fill=self._row_color)
+        if row is not None:
+            canvas.itemconfigure(row["bg"], fill=self._row_hover_color)
+        self._hover_row = row
+
+    def _create_pool_row(self) -> dict:
+        """Create a reusable set of canvas items for one row"""
+        canvas = self.history_canvas
+        tag = f"row{len(self._row_pool)}"
+        text_color = self._row_text_color
+
+        row = {
+            "tag": tag,
+            "entry": None,
+            "index": None,
+            "fit_width": None,
+            "bg": canvas.create_rectangle(
+                0,
+                0,
+                0,
+                0,
+                fill=self._row_color,
+                outline="",
+                tags=(tag,),
+            ),
+            "time": canvas.create_text(
+                0,
+                0,
+                anchor="w",
+                font=ROW_SMALL_FONT,
+                fill=text_color,
+                tags=(tag,),
+            ),
+            "preview": canvas.create_text(
+                0, 0, anchor="w", font=ROW_FONT, fill=text_color, tags=(tag,)
+            ),
+            "info": canvas.create_text(
+                0,
+                0,
+                anchor="e",
+                font=ROW_SMALL_FONT,
+                fill=text_color,
+                tags=(tag,),
+            ),
+        }
+        canvas.itemconfigure(tag, state="hidden")
+        return row
+
+    def _place_row(self, row: dict, y: int) -> None:
+        """Move a pooled row to a vertical offset on the canvas"""
+        canvas = self.history_canvas
+        middle = y + ROW_HEIGHT // 2
+        canvas.coords(
+            row["bg"],
+            ROW_PADDING,
+            y + 2,
+            self._list_width - ROW_PADDING,
+            y + ROW_HEIGHT - 2,
+        )
+        canvas.coords(row["time"], 2 * ROW_PADDING, middle)
+        canvas.coords(row["preview"], PREVIEW_X, middle)
+        canvas.coords(row["info"], self._list_width - 2 * ROW_PADDING, middle)
+
+    def _populate_row(self, row: dict, index: int) -> None:
+        """Show the entry at an index of self.entries in a pooled row"""
+        canvas = self.history_canvas
+        canvas.itemconfigure(row["time"], text=self._timestr[index])
+        canvas.itemconfigure(row["info"], text=self._infostr[index])
+        row["entry"] = self.entries[index]
+        row["fit_width"] = None
+
+    def _fit_preview(self, row: dict, index: int) -> None:
+        """Elide a row's preview to the space left of its info text"""
+        available = (
+            self._list_width
+            - 3 * ROW_PADDING
+            - self._row_small_font.measure(self._infostr[index])
+            - PREVIEW_X
+        )
+        text = self._preview[index]
+        font = self._row_font
+        if font.measure(text) > available:
+            # Longest prefix that still fits with the ellipsis
+            low, high = 0, len(text)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if font.measure(text[:middle] + "...") <= available:
+                    low = middle
+                else:
+                    high = middle - 1
+            text = text[:low].rstrip() + "..." if low else ""
+
+        self.history_canvas.itemconfigure(row["preview"], text=text)
+        row["fit_width"] = self._list_width
 
     def _show_entry_details(self, entry: TranslationEntry) -> None:
-        """Show entry details efficiently"""
-
-        def update_text() -> None:
-            for widget, text in [
-                (self.source_text, entry.source_text),
-                (self.translation_text, entry.translated_text),
-            ]:
-                widget.configure(state="normal")
-                widget.delete("1.0", "end")
-                widget.insert("1.0", text)
-                widget.configure(state="disabled")
-
-        self.after(10, update_text)
+        """Show entry details, skipping text boxes that already match"""
+        if entry is self._current_entry:
+            return
+        self._current_entry = entry
+
+        for widget, text in (
+            (self.source_text, entry.source_text),
+            (self.translation_text, entry.translated_text),
+        ):
+            if widget.get("1.0", "end-1c") == text:
+                continue
+            widget.configure(state="normal")
+            widget.delete("1.0", "end")
+            widget.insert("1.0", text)
+            widget.configure(state="disabled")
@@ -1,11 +1,48 @@
 import logging
-from typing import Protocol
+import tkinter as tk
+from typing import Optional, Protocol, Tuple
 
 import customtkinter as ctk
-import pyperclip
 
 from controllers.window_controller import WindowController
 
+# Constants
+DRAG_THROTTLE_MS = 16  # About one window move per 60 Hz frame
+MOVE_NOTIFY_DELAY_MS = 250  # Quiet period before persisting a position
+GAME_MODE_TEXT_CONFIG = {
+    "fg_color": "black",
+    "text_color": "white",
+    "border_width": 0,
+}
+NORMAL_TEXT_CONFIG = {
+    "fg_color": ("gray90", "gray10"),
+    "text_color": ("black", "white"),
+    "border_width": 1,
+}
+
+
+def _common_prefix_len(old: str, new: str) -> int:
+    """Get the length of the common prefix of two strings"""
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            return i
+    return min(len(old), len(new))
+
+
+class _DragState:
+    """Hot-path state for dragging the window, kept in slots"""
+
+    __slots__ = ("start_x", "start_y", "pending", "after_id", "active")
+
+    def __init__(self):
+        self.start_x = 0
+        self.start_y = 0
+        # Latest requested position, waiting for the throttle timer
+        self.pending: Optional[Tuple[int, int]] = None
+        self.after_id: Optional[str] = None
+        # While dragging, on_drag_end alone reports the position
+        self.active = False
+
 
 class TranslationWindowProtocol(Protocol):
     """Protocol defining the interface for translation window callbacks"""
@@ -23,6 +60,7 @@ class TranslationWindow(ctk.CTkToplevel):
         window_controller: WindowController,
         opacity: float,
         initial_text: str = "",
+        game_mode: bool = False,
     ):
         super().__init__(parent)
 
@@ -31,13 +69,17 @@ class TranslationWindow(ctk.CTkToplevel):
         self._game_mode = False
 
         # Initialize drag variables
-        self.drag_start_x = 0
-        self.drag_start_y = 0
+        self._drag = _DragState()
+        self._last_pos: Optional[Tuple[int, int]] = None
+        self._configure_after_id: Optional[str] = None
+        self._move_notify_id: Optional[str] = None
+        self._has_focus = False
 
         # Create UI
-        self._create_widgets(initial_text)
+        self._create_widgets(initial_text, game_mode)
 
         # Set initial opacity
+        self._opacity = opacity
         self.attributes("-alpha", opacity)
 
         # Configure window
@@ -47,9 +89,16 @@ class TranslationWindow(ctk.CTkToplevel):
 
         # Bind events
         self.bind("<Configure>", self._on_window_configure)
+        self.bind("<FocusIn>", self._on_focus_change, add="+")
+        self.bind("<FocusOut>", self._on_focus_change, add="+")
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def _create_widgets(self, initial_text: str):
+        if game_mode:
+            # Map the window first so click-through can reach its handle
+            self.update_idletasks()
+            self.set_game_mode(True)
+
+    def _create_widgets(self, initial_text: str, game_mode: bool):
         """Create window widgets"""
         # Text area
         self.text_widget = ctk.CTkTextbox(self)
@@ -58,18 +107,14 @@ class TranslationWindow(ctk.CTkToplevel):
         if initial_text:
             self.text_widget.insert("1.0", initial_text)
 
-        # Control panel
-        self.control_panel = ctk.CTkFrame(self)
-        self.control_panel.pack(fill="x", side="bottom", padx=5, pady=5)
+        # set_text is the usual writer, so keep a copy of what it shows
+        self._current_text = initial_text
+        self.text_widget.edit_modified(False)
 
-        # Copy button
-        copy_btn = ctk.CTkButton(
-            self.control_panel,
-            text="Copy",
-            command=self._copy_to_clipboard,
-            width=60,
-        )
-        copy_btn.pack(side="right", padx=5)
+        # Control panel is built on first use; game mode never shows it
+        self.control_panel: Optional[ctk.CTkFrame] = None
+        if not game_mode:
+            self._show_control_panel()
 
         # Make window draggable
         self.text_widget.bind("<Button-1>", self.start_drag)
@@ -78,41 +123,147 @@ class TranslationWindow(ctk.CTkToplevel):
             "<ButtonRelease-1>", lambda _: self.on_drag_end()
         )
 
+        # Swallow mouse events in game mode; bound once, checked per event
+        for widget in (self, self.text_widget):
+            widget.bind("<Button-1>", self._block_in_game_mode, add="+")
+            widget.bind("<B1-Motion>", self._block_in_game_mode, add="+")
+
+    def _show_control_panel(self):
+        """Show the control panel, creating it the first time"""
+        if self.control_panel is None:
+            self.control_panel = ctk.CTkFrame(self)
+
+            # Copy button
+            copy_btn = ctk.CTkButton(
+                self.control_panel,
+                text="Copy",
+                command=self._copy_to_clipboard,
+                width=60,
+            )
+            copy_btn.pack(side="right", padx=5)
+
+        self.control_panel.pack(fill="x", side="bottom", padx=5, pady=5)
+
+    def _block_in_game_mode(self, _event):
+        """Stop mouse events from reaching the widgets in game mode"""
+        if self._game_mode:
+            return "break"
+        return None
+
     def start_drag(self, event):
         """Start window drag"""
         if not self._game_mode:
-            self.drag_start_x = event.x_root - self.winfo_x()
-            self.drag_start_y = event.y_root - self.winfo_y()
+            self._drag.start_x = event.x_root - self.winfo_x()
+            self._drag.start_y = event.y_root - self.winfo_y()
+            self._drag.active = True
 
     def on_drag(self, event):
         """Handle window drag"""
         if not self._game_mode:
-            x = event.x_root - self.drag_start_x
-            y = event.y_root - self.drag_start_y
-            self.geometry(f"+{x}+{y}")
+            self._drag.pending = (
+                event.x_root - self._drag.start_x,
+                event.y_root - self._drag.start_y,
+            )
+            # Throttle window moves to one geometry call per frame
+            if self._drag.after_id is None:
+                self._drag.after_id = self.after(
+                    DRAG_THROTTLE_MS, self._apply_pending_pos
+                )
+
+    def _apply_pending_pos(self):
+        """Move the window to the latest dragged position"""
+        self._drag.after_id = None
+        if self._drag.pending is not None:
+            x, y = self._drag.pending
+            self._drag.pending = None
+            self.wm_geometry("+%d+%d" % (x, y))
 
     def on_drag_end(self):
         """Handle end of drag"""
         if not self._game_mode:
-            self.controller.on_window_move(self.winfo_x(), self.winfo_y())
+            if self._drag.after_id is not None:
+                self.after_cancel(self._drag.after_id)
+                self._apply_pending_pos()
+            self._drag.active = False
+            self._report_position(
+                self.winfo_x(), self.winfo_y(), immediate=True
+            )
 
     def _on_window_configure(self, event):
         """Handle window configuration changes"""
-        if event.widget == self and not self._game_mode:
-            self.controller.on_window_move(self.winfo_x(), self.winfo_y())
+        # Configure bubbles up from every child; identity is the cheap check
+        if event.widget is not self or self._game_mode or self._drag.active:
+            return
+
+        # Coalesce bursts of Configure events into one idle check
+        if self._configure_after_id is None:
+            self._configure_after_id = self.after_idle(self._flush_configure)
+
+    def _flush_configure(self):
+        """Report the window position once pending Configure events settle"""
+        self._configure_after_id = None
+        if self._game_mode or self._drag.active:
+            return
+
+        self._report_position(self.winfo_x(), self.winfo_y())
+
+    def _report_position(self, x: int, y: int, immediate: bool = False):
+        """Notify the controller of a move once the window settles"""
+        if self._move_notify_id is not None:
+            self.after_cancel(self._move_notify_id)
+            self._move_notify_id = None
+        elif (x, y) == self._last_pos:
+            return
+
+        if immediate:
+            self._notify_move(x, y)
+        else:
+            # Trailing debounce: only the last position of a burst is sent
+            self._move_notify_id = self.after(
+                MOVE_NOTIFY_DELAY_MS, self._notify_move, x, y
+            )
+
+    def _notify_move(self, x: int, y: int):
+        """Send a settled position to the controller unless unchanged"""
+        self._move_notify_id = None
+        # Configure also fires for resizes; only report actual moves
+        if (x, y) != self._last_pos:
+            self._last_pos = (x, y)
+            self.controller.on_window_move(x, y)
 
     def _copy_to_clipboard(self):
         """Copy text to clipboard"""
-        text = self.text_widget.get("1.0", "end-1c")
-        pyperclip.copy(text)
+        text = self._displayed_text()
+        self.clipboard_clear()
+        self.clipboard_append(text)
+        self.update_idletasks()
         self.controller.on_copy_text(text)
 
+    def _displayed_text(self) -> str:
+        """Get the shown text, only reading it back from Tk after edits"""
+        if self.text_widget.edit_modified():
+            self._current_text = self.text_widget.get("1.0", "end-1c")
+            self.text_widget.edit_modified(False)
+        return self._current_text
+
     def set_text(self, text: str):
         """Set translation text"""
         try:
-            # Update text
-            self.text_widget.delete("1.0", "end")
-            self.text_widget.insert("1.0", text)
+            current = self._displayed_text()
+            if text == current:
+                # Stable scene: skip the textbox reflow entirely
+                return True
+
+            # Only replace the part after the common prefix. Tk counts
+            # astral characters differently, so fall back to a full
+            # replace when the prefix contains any
+            i = _common_prefix_len(current, text)
+            if len(text[:i].encode("utf-16-le")) != 2 * i:
+                i = 0
+            self.text_widget.delete(f"1.0 + {i} chars", "end")
+            self.text_widget.insert("end", text[i:])
+            self._current_text = text
+            self.text_widget.edit_modified(False)
             self.text_widget.update()  # Force update
             return True
         except Exception as e:
@@ -127,70 +278,91 @@ class TranslationWindow(ctk.CTkToplevel):
 
     def set_game_mode(self, enabled: bool):
         """Set game mode state"""
+        if enabled == self._game_mode:
+            # Already in the requested state; skip the Tk reconfiguration
+            return
         self._game_mode = enabled
 
-        # Store current opacity
-        current_opacity = self.attributes("-alpha")
-
         if enabled:
             # Remove window decorations
             self.overrideredirect(True)
             # Make window click-through
             self.window_controller.set_click_through(self, True)
             # Update appearance
-            self.configure(fg_color="black")
-            self.text_widget.configure(
-                fg_color="black",
-                text_color="white",
-                border_width=0,
-            )
+            self.configure(fg_color=GAME_MODE_TEXT_CONFIG["fg_color"])
+            self.text_widget.configure(**GAME_MODE_TEXT_CONFIG)
             # Hide control panel
-            self.control_panel.pack_forget()
-            # Disable mouse events
-            self.bind("<Button-1>", lambda e: "break")
-            self.bind("<B1-Motion>", lambda e: "break")
-            self.text_widget.bind("<Button-1>", lambda e: "break")
-            self.text_widget.bind("<B1-Motion>", lambda e: "break")
-            # Ensure window stays visible
+            if self.control_panel is not None:
+                self.control_panel.pack_forget()
+            # The focus flag is stale after a decoration change
             self.lift()
             self.focus_force()
-            # Restore opacity
-            self.attributes("-alpha", current_opacity)
         else:
             # Restore window decorations
             self.overrideredirect(False)
             # Disable click-through
             self.window_controller.set_click_through(self, False)
             # Restore appearance
-            self.configure(fg_color=("gray90", "gray10"))
-            self.text_widget.configure(
-                fg_color=("gray90", "gray10"),
-                text_color=("black", "white"),
-                border_width=1,
-            )
+            self.configure(fg_color=NORMAL_TEXT_CONFIG["fg_color"])
+            self.text_widget.configure(**NORMAL_TEXT_CONFIG)
             # Show control panel
-            self.control_panel.pack(fill="x", side="bottom", padx=5, pady=5)
-            # Enable mouse events
-            self.bind("<Button-1>", lambda e: None)
-            self.bind("<B1-Motion>", lambda e: None)
-            self.text_widget.bind("<Button-1>", lambda e: None)
-            self.text_widget.bind("<B1-Motion>", lambda e: None)
-            # Restore opacity
-            self.attributes("-alpha", current_opacity)
+            self._show_control_panel()
+            # Redecorating can drop the window behind others
+            self.lift()
+            self.focus_force()
+
+        # Some window managers reset alpha when decorations change
+        self._restore_opacity()
+
+    def _on_focus_change(self, event):
+        """Track whether the window currently has keyboard focus"""
+        self._has_focus = event.type == tk.EventType.FocusIn
+
+    def bring_to_front(self):
+        """Raise and focus the window unless it already has focus"""
+        if not self._has_focus:
+            self.lift()
+            self.focus_force()
 
     def set_position(self, x: int, y: int):
-        """Set window position"""
-        self.geometry(f"+{x}+{y}")
-        self.controller.on_window_move(x, y)
+        """Set window position unless the window is already there"""
+        position = "+%d+%d" % (x, y)
+        if not self.geometry().endswith(position):
+            self.wm_geometry(position)
+        self._report_position(x, y, immediate=True)
 
     def set_size(self, width: int, height: int):
-        """Set window size"""
-        self.geometry(f"{width}x{height}")
+        """Set window size unless it already matches"""
+        # CTk scales sizes, so both the check and the change go through
+        # its geometry(); the current size is read back, not cached
+        size = "%dx%d" % (width, height)
+        if not self.geometry().startswith((size + "+", size + "-")):
+            self.geometry(size)
+
+    def _restore_opacity(self):
+        """Reapply the window opacity if a mode switch reset it"""
+        if self.attributes("-alpha") != self._opacity:
+            self.attributes("-alpha", self._opacity)
 
     def set_opacity(self, value: float):
         """Set window opacity"""
+        self._opacity = value
         self.window_controller.set_window_opacity(self, value)
 
     def cleanup(self):
         """Clean up resources"""
         self.destroy()
+
+    def destroy(self):
+        """Cancel pending timers before destroying the window"""
+        for after_id in (
+            self._drag.after_id,
+            self._configure_after_id,
+            self._move_notify_id,
+        ):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._drag.after_id = None
+        self._configure_after_id = None
+        self._move_notify_id = None
+        super().destroy()